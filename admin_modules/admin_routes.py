@@ -7,8 +7,13 @@ Includes profile viewing, updating, and image upload functionality.
 # STANDARD LIBRARY IMPORTS
 # ==========================================================
 
+import os
 import re
+import string
+import sys
 import logging
+from functools import lru_cache
+from hmac import compare_digest
 from typing import Optional, Dict, Any, Tuple
 
 # ==========================================================
@@ -16,11 +21,19 @@ from typing import Optional, Dict, Any, Tuple
 # ==========================================================
 
 import mysql.connector
+from mysql.connector import pooling
 from flask import (
     Blueprint, render_template, redirect,
     url_for, session, request, flash
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+
+try:
+    from db import hash_password
+except ImportError:
+    # Direct script run from admin_modules/: db.py lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db import hash_password
 
 # ==========================================================
 # APPLICATION CONFIGURATION
@@ -33,6 +46,16 @@ DB_CONFIG = {
     'database': 'iload'
 }
 
+DB_POOL_NAME = 'admin'
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '8'))
+
+if not 1 <= DB_POOL_SIZE <= pooling.CNX_POOL_MAXSIZE:
+    # Fail at startup rather than on the first pooled request.
+    raise ValueError(
+        f"Invalid DB_POOL_SIZE {DB_POOL_SIZE}: "
+        f"must be between 1 and {pooling.CNX_POOL_MAXSIZE}"
+    )
+
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
 PASSWORD_MIN_LENGTH = 8
@@ -64,20 +87,35 @@ ERROR_MESSAGES = {
 
 SQL_QUERIES = {
     'select_password': 'SELECT password FROM instructors WHERE username = %s',
+    'select_name': 'SELECT name FROM instructors WHERE username = %s',
     'update_instructors': 'UPDATE instructors SET {} WHERE username = %s'
 }
 
+# Anchored with \A...\Z so match() checks the whole value. Usernames keep
+# Unicode \w since existing accounts are not restricted to ASCII.
 VALIDATION_PATTERNS = {
-    'name': re.compile(r"^[A-Za-z\s\-\.']{1,100}$"),
-    'username': re.compile(r'^\w{3,50}$'),
-    'department': re.compile(r'^[A-Za-z0-9\s\-\.&,]{1,100}$')
+    'name': re.compile(r"\A[A-Za-z\s\-\.']{1,100}\Z", re.ASCII),
+    'username': re.compile(r'\A\w{3,50}\Z'),
+    'department': re.compile(r'\A[A-Za-z0-9\s\-\.&,]{1,100}\Z', re.ASCII)
 }
 
+_PW_UPPER = frozenset(string.ascii_uppercase)
+_PW_LOWER = frozenset(string.ascii_lowercase)
+_PW_DIGITS = frozenset(string.digits)
+_PW_SPECIAL = frozenset('!@#$%^&*(),.?":{}|<>')
+_PW_TOO_SHORT_MESSAGE = ERROR_MESSAGES['password_too_short'].format(PASSWORD_MIN_LENGTH)
+
+# (form field, sanitize_input type, ERROR_MESSAGES key)
+_TEXT_FIELDS = (
+    ('name', 'name', 'invalid_name'),
+    ('department', 'department', 'invalid_department'),
+)
+
 # ==========================================================
 # LOGGING SETUP
 # ==========================================================
 
-logging.basicConfig(level=logging.INFO)
+# Handlers and format are configured once by the application (app.py).
 logger = logging.getLogger(__name__)
 
 # ==========================================================
@@ -89,13 +127,10 @@ def sanitize_input(value: Optional[str], value_type: str = 'string') -> Optional
     if value is None:
         return None
 
-    value = str(value).strip()
+    value = value.strip()
 
-    if value_type == 'name' and not VALIDATION_PATTERNS['name'].match(value):
-        return None
-    if value_type == 'department' and not VALIDATION_PATTERNS['department'].match(value):
-        return None
-    if value_type == 'username' and not VALIDATION_PATTERNS['username'].match(value):
+    pattern = VALIDATION_PATTERNS.get(value_type)
+    if pattern is not None and not pattern.match(value):
         return None
 
     return value
@@ -114,33 +149,56 @@ def validate_load_units(units: Optional[str]) -> Optional[int]:
 
 def validate_password_strength(password: str) -> Tuple[bool, str]:
     """Validate password complexity."""
+    long_enough = len(password) >= PASSWORD_MIN_LENGTH
+    # set.isdisjoint walks the string in C and stops at the first hit.
+    has_upper = not _PW_UPPER.isdisjoint(password)
+    has_lower = not _PW_LOWER.isdisjoint(password)
+    has_digit = (
+        not _PW_DIGITS.isdisjoint(password)
+        or any(map(str.isdecimal, password))
+    )
+    has_special = not _PW_SPECIAL.isdisjoint(password)
+
+    if long_enough and has_upper and has_lower and has_digit and has_special:
+        return True, ''
+
     checks = [
-        (len(password) >= PASSWORD_MIN_LENGTH,
-         ERROR_MESSAGES['password_too_short'].format(PASSWORD_MIN_LENGTH)),
-        (re.search(r'[A-Z]', password),
-         ERROR_MESSAGES['password_missing_uppercase']),
-        (re.search(r'[a-z]', password),
-         ERROR_MESSAGES['password_missing_lowercase']),
-        (re.search(r'\d', password),
-         ERROR_MESSAGES['password_missing_number']),
-        (re.search(r'[!@#$%^&*(),.?":{}|<>]', password),
-         ERROR_MESSAGES['password_missing_special']),
+        (long_enough, _PW_TOO_SHORT_MESSAGE),
+        (has_upper, ERROR_MESSAGES['password_missing_uppercase']),
+        (has_lower, ERROR_MESSAGES['password_missing_lowercase']),
+        (has_digit, ERROR_MESSAGES['password_missing_number']),
+        (has_special, ERROR_MESSAGES['password_missing_special']),
     ]
-
     errors = [msg for passed, msg in checks if not passed]
-    return not errors, ' '.join(errors)
+    return False, ' '.join(errors)
 
 # ==========================================================
 # DATABASE ACCESS HELPERS
 # ==========================================================
 
+@lru_cache(maxsize=1)
+def _get_pool() -> pooling.MySQLConnectionPool:
+    """Create the shared connection pool on first use."""
+    return pooling.MySQLConnectionPool(
+        pool_name=DB_POOL_NAME,
+        pool_size=DB_POOL_SIZE,
+        pool_reset_session=True,
+        **DB_CONFIG
+    )
+
+
+def get_db_connection():
+    """Borrow a pooled connection; close() hands it back to the pool."""
+    return _get_pool().get_connection()
+
+
 def safe_db_operation(operation):
     """Safely execute DB operation."""
     connection = None
     cursor = None
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        cursor = connection.cursor()
+        connection = get_db_connection()
+        cursor = connection.cursor(dictionary=True)
         result = operation(cursor)
         connection.commit()
         return result
@@ -156,13 +214,20 @@ def safe_db_operation(operation):
             connection.close()
 
 
-def fetchone_dict(cursor):
-    """Fetch one row as dict to mimic dictionary=True behavior."""
-    row = cursor.fetchone()
-    if row is None:
+def get_instructor_name(username: Optional[str]) -> Optional[str]:
+    """Return the display name for a username, or None if unavailable."""
+    if not username:
+        return None
+
+    def operation(cursor):
+        cursor.execute(SQL_QUERIES['select_name'], (username,))
+        return cursor.fetchone()
+
+    try:
+        row = safe_db_operation(operation)
+    except mysql.connector.Error:
         return None
-    columns = [col[0] for col in cursor.description]
-    return dict(zip(columns, row))
+    return row['name'] if row else None
 
 # ==========================================================
 # PASSWORD CHANGE INTERNAL VALIDATION
@@ -177,7 +242,11 @@ def _validate_password_inputs(
         return None
     if not all((current_pw, new_pw, confirm_pw)):
         return 'All password fields are required.'
-    if not all(isinstance(pw, str) for pw in (current_pw, new_pw, confirm_pw)):
+    if (
+        type(current_pw) is not str
+        or type(new_pw) is not str
+        or type(confirm_pw) is not str
+    ):
         return 'Invalid password format.'
     return None
 
@@ -187,7 +256,9 @@ def _validate_new_password(
     new_pw: str,
     confirm_pw: str
 ) -> Optional[str]:
-    if new_pw != confirm_pw:
+    # Secrets are compared with compare_digest so timing does not reveal how
+    # much of a prefix matched; check_password_hash already does this itself.
+    if not compare_digest(new_pw.encode(), confirm_pw.encode()):
         return ERROR_MESSAGES['password_mismatch']
     if check_password_hash(stored_hash, new_pw):
         return 'New password must differ from old password.'
@@ -197,6 +268,7 @@ def _validate_new_password(
         return ERROR_MESSAGES['password_error'].format(message)
     return None
 
+
 # ==========================================================
 # PASSWORD CHANGE PROCESSING
 # ==========================================================
@@ -208,6 +280,9 @@ def process_password_change(
     confirm_pw: Optional[str]
 ) -> Tuple[Optional[str], Optional[str]]:
     """Process password change request."""
+    if not any((current_pw, new_pw, confirm_pw)):
+        return None, None
+
     sanitized_username = sanitize_input(username, 'username')
     if not sanitized_username:
         return None, 'Invalid username.'
@@ -216,32 +291,29 @@ def process_password_change(
     if error:
         return None, error
 
-    if not any((current_pw, new_pw, confirm_pw)):
-        return None, None
-
     def operation(cursor):
         cursor.execute(SQL_QUERIES['select_password'], (sanitized_username,))
-        user = fetchone_dict(cursor)
-        if not user:
-            return None, ERROR_MESSAGES['user_not_found']
-
-        stored_hash = user['password']
-        if not check_password_hash(stored_hash, current_pw):
-            return None, ERROR_MESSAGES['current_password_incorrect']
-
-        validation_error = _validate_new_password(
-            stored_hash, new_pw, confirm_pw
-        )
-        if validation_error:
-            return None, validation_error
-
-        return generate_password_hash(new_pw), None
+        return cursor.fetchone()
 
+    # Only the SELECT needs the connection; hashing runs after it is released.
     try:
-        return safe_db_operation(operation)
+        user = safe_db_operation(operation)
     except mysql.connector.Error:
         return None, ERROR_MESSAGES['general_error']
 
+    if not user:
+        return None, ERROR_MESSAGES['user_not_found']
+
+    stored_hash = user['password']
+    if not check_password_hash(stored_hash, current_pw):
+        return None, ERROR_MESSAGES['current_password_incorrect']
+
+    validation_error = _validate_new_password(stored_hash, new_pw, confirm_pw)
+    if validation_error:
+        return None, validation_error
+
+    return hash_password(new_pw), None
+
 # ==========================================================
 # FORM DATA COLLECTION & VALIDATION
 # ==========================================================
@@ -260,48 +332,55 @@ def _collect_text(
     return value, None
 
 
+def _text_field(field: str, field_type: str, error_key: str):
+    def collect(form, _username: str) -> Tuple[Optional[str], Optional[str]]:
+        return _collect_text(form, field, field_type, ERROR_MESSAGES[error_key])
+    return collect
+
+
+def _collect_load_units(form, _username: str) -> Tuple[Optional[int], Optional[str]]:
+    units = form.get('max_load_units')
+    if units is None:
+        return None, None
+    validated = validate_load_units(units)
+    if validated is None:
+        return None, ERROR_MESSAGES['invalid_load_units']
+    return validated, None
+
+
+def _collect_password(form, username: str) -> Tuple[Optional[str], Optional[str]]:
+    return process_password_change(
+        username,
+        form.get('current_password'),
+        form.get('new_password'),
+        form.get('confirm_password')
+    )
+
+
+# (update_data key, collector(form, username) -> (value, error)), in the
+# order errors are reported.
+_FORM_FIELDS = tuple(
+    (field, _text_field(field, field_type, error_key))
+    for field, field_type, error_key in _TEXT_FIELDS
+) + (
+    ('max_load_units', _collect_load_units),
+    ('hashed_password', _collect_password),
+)
+
+
 def collect_form_data(username: str) -> Tuple[Dict[str, Any], Optional[str]]:
     """Collect and validate form data."""
     update_data: Dict[str, Any] = {}
     errors = []
 
-    name, err = _collect_text(
-        request.form, 'name', 'name', ERROR_MESSAGES['invalid_name']
-    )
-    if err:
-        errors.append(err)
-    elif name:
-        update_data['name'] = name
-
-    department, err = _collect_text(
-        request.form, 'department', 'department',
-        ERROR_MESSAGES['invalid_department']
-    )
-    if err:
-        errors.append(err)
-    elif department:
-        update_data['department'] = department
-
-    units = request.form.get('max_load_units')
-    if units is not None:
-        validated = validate_load_units(units)
-        if validated is None:
-            errors.append(ERROR_MESSAGES['invalid_load_units'])
-        else:
-            update_data['max_load_units'] = validated
-
-    current_pw = request.form.get('current_password')
-    new_pw = request.form.get('new_password')
-    confirm_pw = request.form.get('confirm_password')
-
-    if any((current_pw, new_pw, confirm_pw)):
-        hashed, err = process_password_change(
-            username, current_pw, new_pw, confirm_pw
-        )
+    form = request.form
+
+    for key, collect in _FORM_FIELDS:
+        value, err = collect(form, username)
         if err:
             errors.append(err)
-        elif hashed:
-            update_data['hashed_password'] = hashed
+        elif value is not None:
+            update_data[key] = value
 
     if errors:
         return {}, ' '.join(errors)
@@ -6,12 +6,12 @@ SonarQube & Pylint compliant version
 
 from __future__ import annotations
 
+import heapq
 import os
 import sys
 import time
 from collections import deque
-from datetime import datetime
-from functools import lru_cache, wraps
+from functools import wraps
 from typing import Dict, List, Optional, Tuple
 
 from flask import (
@@ -59,7 +59,6 @@ auto_scheduler_bp = Blueprint(
 )
 
 AUTO_SCHEDULER_HOME = "auto_scheduler.auto_scheduler_home"
-TIME_FORMAT = "%H:%M"
 
 FLASH_CATEGORIES = {
     "warning": "warning",
@@ -74,12 +73,6 @@ ERROR_MESSAGES = {
     "schedule_failed": "Failed to generate schedule.",
 }
 
-# ==========================================================
-# Global Caches
-# ==========================================================
-
-_COMPATIBILITY_CACHE: Dict[Tuple[int, int], bool] = {}
-
 # ==========================================================
 # Security / Access
 # ==========================================================
@@ -108,17 +101,30 @@ def validate_admin_access(func):
 # ==========================================================
 
 
-@lru_cache(maxsize=10_000)
-def intervals_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
-    """Check if two time intervals overlap."""
+def _to_minutes(time_str: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight."""
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
 
-    def to_minutes(time_str: str) -> int:
-        hours, minutes = map(int, time_str.split(":"))
-        return hours * 60 + minutes
 
-    return not (
-        to_minutes(end1) <= to_minutes(start2)
-        or to_minutes(end2) <= to_minutes(start1)
+def _parse_hhmm(value: str) -> Optional[int]:
+    """Parse a strict "HH:MM" string into minutes since midnight, or None."""
+    if len(value) != 5 or value[2] != ":":
+        return None
+    hours, minutes = value[:2], value[3:]
+    if not (value.isascii() and hours.isdigit() and minutes.isdigit()):
+        return None
+    hours_int, minutes_int = int(hours), int(minutes)
+    if hours_int > 23 or minutes_int > 59:
+        return None
+    return hours_int * 60 + minutes_int
+
+
+def intervals_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
+    """Check if two time intervals overlap."""
+    return (
+        _to_minutes(start1) < _to_minutes(end2)
+        and _to_minutes(start2) < _to_minutes(end1)
     )
 
 
@@ -127,47 +133,54 @@ def intervals_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
 # ==========================================================
 
 
-class GroupKey:
-    """Hashable key representing a session group."""
-
-    __slots__ = ("hash_val",)
-
-    def __init__(self, group: List[Dict]):
-        self.hash_val = hash(
-            tuple(
-                (
-                    session["subject_id"],
-                    session["instructor_id"],
-                    session["room_id"],
-                    session["day_of_week"],
-                    session["start_time"],
-                    session["end_time"],
-                )
-                for session in group
-            )
+def _pack_rows(group: List[Dict], day_ids: Dict[str, int]) -> Tuple:
+    """
+    Pack a session group into (day, start, end, room, instructor) integer
+    rows. Day names are numbered through day_ids, which the caller owns for
+    the duration of one solve.
+    """
+    return tuple(
+        (
+            day_ids.setdefault(session["day_of_week"], len(day_ids)),
+            _to_minutes(session["start_time"]),
+            _to_minutes(session["end_time"]),
+            session["room_id"],
+            session["instructor_id"],
         )
+        for session in group
+    )
 
-    def __hash__(self) -> int:
-        return self.hash_val
 
+class GroupArrays:
+    """Session group packed into integer rows for conflict checks."""
 
-def _sessions_conflict(session_a: Dict, session_b: Dict) -> bool:
-    """Determine if two sessions conflict."""
-    if session_a["day_of_week"] != session_b["day_of_week"]:
-        return False
+    __slots__ = ("rows", "by_day", "day_mask", "day_rooms", "day_instrs")
 
-    if not intervals_overlap(
-        session_a["start_time"],
-        session_a["end_time"],
-        session_b["start_time"],
-        session_b["end_time"],
-    ):
-        return False
+    def __init__(self, group: List[Dict], day_ids: Dict[str, int]):
+        self.rows = _pack_rows(group, day_ids)
+        by_day: Dict[int, List[Tuple]] = {}
+        for row in self.rows:
+            by_day.setdefault(row[0], []).append(row)
+        self.by_day = {day: tuple(rows) for day, rows in by_day.items()}
+        self.day_mask = 0
+        for day in self.by_day:
+            self.day_mask |= 1 << day
+        self.day_rooms = frozenset((row[0], row[3]) for row in self.rows)
+        self.day_instrs = frozenset((row[0], row[4]) for row in self.rows)
 
-    return (
-        session_a["room_id"] == session_b["room_id"]
-        or session_a["instructor_id"] == session_b["instructor_id"]
-    )
+
+def _sessions_conflict(rows_a: Tuple, rows_b: Tuple) -> bool:
+    """Determine if any session in rows_a conflicts with one in rows_b."""
+    for day_a, start_a, end_a, room_a, instr_a in rows_a:
+        for day_b, start_b, end_b, room_b, instr_b in rows_b:
+            if (
+                day_a == day_b
+                and start_a < end_b
+                and start_b < end_a
+                and (room_a == room_b or instr_a == instr_b)
+            ):
+                return True
+    return False
 
 
 def groups_compatible(group_a: List[Dict], group_b: List[Dict]) -> bool:
@@ -178,19 +191,23 @@ def groups_compatible(group_a: List[Dict], group_b: List[Dict]) -> bool:
     if not group_a or not group_b:
         return True
 
-    key = (GroupKey(group_a).hash_val, GroupKey(group_b).hash_val)
-    cached_result = _COMPATIBILITY_CACHE.get(key)
-    if cached_result is not None:
-        return cached_result
+    day_ids: Dict[str, int] = {}
+    packed_a = GroupArrays(group_a, day_ids)
+    packed_b = GroupArrays(group_b, day_ids)
 
-    for session_a in group_a:
-        for session_b in group_b:
-            if _sessions_conflict(session_a, session_b):
-                _COMPATIBILITY_CACHE[key] = False
-                return False
+    # Sessions can only clash on a shared day and a shared room or instructor.
+    if not packed_a.day_mask & packed_b.day_mask or (
+        packed_a.day_rooms.isdisjoint(packed_b.day_rooms)
+        and packed_a.day_instrs.isdisjoint(packed_b.day_instrs)
+    ):
+        return True
 
-    _COMPATIBILITY_CACHE[key] = True
-    return True
+    by_day_b = packed_b.by_day
+    return not any(
+        _sessions_conflict(rows, by_day_b[day])
+        for day, rows in packed_a.by_day.items()
+        if day in by_day_b
+    )
 
 
 # ==========================================================
@@ -198,63 +215,299 @@ def groups_compatible(group_a: List[Dict], group_b: List[Dict]) -> bool:
 # ==========================================================
 
 
+ConflictMasks = Dict[Tuple[str, int], Dict[str, int]]
+
+
+def _conflict_masks(domains: Dict[str, List[List[Dict]]]) -> ConflictMasks:
+    """
+    Map every (variable, value index) to {other variable: bitmask of the
+    value indexes it conflicts with}. Sessions are bucketed by (day, room)
+    and (day, instructor) and swept by start time, so only overlapping
+    sessions on the same resource are compared.
+    """
+    day_ids: Dict[str, int] = {}
+    buckets: Dict[Tuple[int, int, int], List[Tuple[int, int, str, int]]] = {}
+    for variable, domain in domains.items():
+        for index, value in enumerate(domain):
+            for day, start, end, room, instr in _pack_rows(value, day_ids):
+                entry = (start, end, variable, index)
+                buckets.setdefault((0, day, room), []).append(entry)
+                buckets.setdefault((1, day, instr), []).append(entry)
+
+    masks: ConflictMasks = {}
+    for entries in buckets.values():
+        entries.sort()
+        for pos, (_start_a, end_a, var_a, index_a) in enumerate(entries):
+            for start_b, _end_b, var_b, index_b in entries[pos + 1:]:
+                if start_b >= end_a:
+                    break
+                if var_a != var_b:
+                    masks_a = masks.setdefault((var_a, index_a), {})
+                    masks_a[var_b] = masks_a.get(var_b, 0) | (1 << index_b)
+                    masks_b = masks.setdefault((var_b, index_b), {})
+                    masks_b[var_a] = masks_b.get(var_a, 0) | (1 << index_a)
+    return masks
+
+
 def ac3(domains: Dict[str, List[List[Dict]]]) -> bool:
-    """AC-3 constraint propagation algorithm."""
+    """
+    AC-3 constraint propagation algorithm.
+    Domains are tracked as bitmasks of live value indexes; each arc keeps
+    a conflict mask per value, so support is a single big-int AND.
+    """
+    live = {x: (1 << len(domain)) - 1 for x, domain in domains.items()}
+    conflicts: Dict[Tuple[str, str], Dict[int, int]] = {}
+    for (xi, i), per_variable in _conflict_masks(domains).items():
+        for xj, mask in per_variable.items():
+            conflicts.setdefault((xi, xj), {})[i] = mask
+
+    # Shrinking xi can only affect (xk, xi) when xk has values clashing with xi.
+    neighbours: Dict[str, List[str]] = {x: [] for x in domains}
+    for xk, xi in conflicts:
+        neighbours[xi].append(xk)
+
     queue = deque((x, y) for x in domains for y in domains if x != y)
+    in_queue = set(queue)
+    consistent = True
 
     while queue:
-        xi, xj = queue.popleft()
-        if revise(domains, xi, xj):
-            if not domains[xi]:
+        arc = queue.popleft()
+        in_queue.discard(arc)
+        xi, xj = arc
+        if revise(live, conflicts.get(arc), xi, xj):
+            if not live[xi]:
+                consistent = False
+                break
+            for xk in neighbours[xi]:
+                if xk != xj:
+                    arc = (xk, xi)
+                    if arc not in in_queue:
+                        queue.append(arc)
+                        in_queue.add(arc)
+
+    for x, domain in domains.items():
+        mask = live[x]
+        if mask != (1 << len(domain)) - 1:
+            domains[x] = [value for i, value in enumerate(domain) if mask >> i & 1]
+    return consistent
+
+
+def revise(
+    live: Dict[str, int],
+    arc_masks: Optional[Dict[int, int]],
+    xi: str,
+    xj: str,
+) -> bool:
+    """Revise the live bitmask of xi against xj for AC-3."""
+    live_x = live[xi]
+    live_y = live[xj]
+    if not live_y:
+        live[xi] = 0
+        return live_x != 0
+    if not arc_masks:
+        return False
+
+    new_x = live_x
+    for i, conflict_mask in arc_masks.items():
+        # Only values clashing with xj can lose all their support there.
+        if not live_y & ~conflict_mask:
+            new_x &= ~(1 << i)
+
+    if new_x == live_x:
+        return False
+    live[xi] = new_x
+    return True
+
+
+# ==========================================================
+# Backtracking Search
+# ==========================================================
+
+
+def _prune(
+    live: Dict[str, int],
+    value_masks: Dict[str, int],
+    pending: set,
+    trail: List[Tuple[str, int]],
+) -> bool:
+    """
+    Remove values of unassigned variables that conflict with a chosen
+    value, recording old masks on the trail. Returns False on a wipe-out.
+    """
+    for other, mask in value_masks.items():
+        if other not in pending:
+            continue
+        old = live[other]
+        new = old & ~mask
+        if new != old:
+            trail.append((other, old))
+            live[other] = new
+            if not new:
                 return False
-            for xk in domains:
-                if xk not in (xi, xj):
-                    queue.append((xk, xi))
     return True
 
 
-def revise(domains: Dict, xi: str, xj: str) -> bool:
-    """Revise domains for AC-3."""
-    revised = False
-    valid_values = []
+def _undo(live: Dict[str, int], trail: List[Tuple[str, int]], mark: int) -> None:
+    """Restore live masks recorded on the trail since mark."""
+    while len(trail) > mark:
+        variable, old = trail.pop()
+        live[variable] = old
 
-    for value_x in domains[xi]:
-        if any(groups_compatible(value_x, value_y) for value_y in domains[xj]):
-            valid_values.append(value_x)
-        else:
-            revised = True
 
-    domains[xi] = valid_values
-    return revised
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
 
 
-# ==========================================================
-# Backtracking Search
-# ==========================================================
+def _search(
+    assignment: Dict[str, List[Dict]],
+    plan: Dict[str, Tuple[List[int], List[List[Dict]]]],
+    live: Dict[str, int],
+    masks: ConflictMasks,
+) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Depth-first search using an explicit stack.
+    Choosing a value forward-checks unassigned variables through their live
+    bitmasks; undo restores them from a trail instead of copying domains.
+    The next variable is the one with the fewest live values (MRV), taken
+    from a heap with lazy deletion.
+    """
+    if not plan:
+        return assignment
+
+    rank = {variable: position for position, variable in enumerate(plan)}
+    pending = set(plan)
+    # Entries are (live count when pushed, rank, variable). Every pending
+    # variable keeps at least one entry whose count is <= its current count:
+    # shrinking pushes a fresh entry, and undo only ever grows domains.
+    heap = [(_popcount(live[v]), rank[v], v) for v in plan]
+    heapq.heapify(heap)
+
+    def select() -> str:
+        while True:
+            count, position, variable = heapq.heappop(heap)
+            if variable not in pending:
+                continue
+            actual = _popcount(live[variable])
+            if actual != count:
+                heapq.heappush(heap, (actual, position, variable))
+                continue
+            pending.discard(variable)
+            return variable
+
+    trail: List[Tuple[str, int]] = []
+    # pruners[v]: assigned variables that removed values from v, one entry
+    # per trail record. conflicts[v]: variables blamed for v's failed values.
+    pruners: Dict[str, List[str]] = {v: [] for v in plan}
+    conflicts: Dict[str, set] = {}
+    depth_of: Dict[str, int] = {}
+
+    def retract(mark: int) -> None:
+        for other, _old in trail[mark:]:
+            pruners[other].pop()
+        _undo(live, trail, mark)
+
+    def push_frame(variable: str) -> None:
+        conflicts[variable] = set()
+        depth_of[variable] = len(frames)
+        frames.append([variable, iter(plan[variable][0]), None])
+
+    def drop_frame() -> None:
+        variable, _candidates, chosen_mark = frames.pop()
+        if chosen_mark is not None:
+            retract(chosen_mark)
+            assignment.pop(variable)
+        del depth_of[variable]
+        pending.add(variable)
+        heapq.heappush(heap, (_popcount(live[variable]), rank[variable], variable))
+
+    # Frames are [variable, candidate iterator, trail mark of chosen value].
+    frames: List[list] = []
+    push_frame(select())
+
+    while frames:
+        frame = frames[-1]
+        variable, candidates, chosen_mark = frame
+        if chosen_mark is not None:
+            retract(chosen_mark)
+            assignment.pop(variable)
+            frame[2] = None
+
+        for index in candidates:
+            if not live[variable] >> index & 1:
+                continue
+            mark = len(trail)
+            if _prune(live, masks.get((variable, index), {}), pending, trail):
+                assignment[variable] = plan[variable][1][index]
+                frame[2] = mark
+                for other, _old in trail[mark:]:
+                    pruners[other].append(variable)
+                    heapq.heappush(
+                        heap, (_popcount(live[other]), rank[other], other)
+                    )
+                break
+            # The wiped-out variable's earlier pruners share the blame.
+            conflicts[variable].update(pruners[trail[-1][0]])
+            _undo(live, trail, mark)
+        else:
+            # Dead end: jump back to the deepest variable responsible for it
+            # (conflict-directed backjumping) instead of the previous frame.
+            blamed = conflicts[variable].union(pruners[variable])
+            blamed.discard(variable)
+            if not blamed:
+                return None
+            target = max(blamed, key=depth_of.__getitem__)
+            while frames[-1][0] != target:
+                drop_frame()
+            blamed.discard(target)
+            conflicts[target].update(blamed)
+            continue
+
+        if not pending:
+            return assignment
+        push_frame(select())
+
+    return None
 
 
 def backtrack(
     assignment: Dict[str, List[Dict]],
     domains: Dict[str, List[List[Dict]]],
 ) -> Optional[Dict[str, List[Dict]]]:
-    """Backtracking CSP solver."""
-    if len(assignment) == len(domains):
-        return assignment
-
-    variable = min(
-        (v for v in domains if v not in assignment),
-        key=lambda v: len(domains[v]),
+    """
+    Backtracking CSP solver.
+    Least-constraining-value order is computed once up front from the
+    initial domains; variables are picked dynamically by MRV.
+    """
+    unassigned = {v: domains[v] for v in domains if v not in assignment}
+    # Pre-assigned values take part as singleton domains so they prune too.
+    masks = _conflict_masks(
+        {**{v: [value] for v, value in assignment.items()}, **unassigned}
     )
 
-    for value in domains[variable]:
-        if all(groups_compatible(value, assignment[v]) for v in assignment):
-            assignment[variable] = value
-            result = backtrack(assignment, domains)
-            if result is not None:
-                return result
-            assignment.pop(variable)
+    live = {v: (1 << len(domain)) - 1 for v, domain in unassigned.items()}
+    for v in assignment:
+        for other, mask in masks.get((v, 0), {}).items():
+            if other in live:
+                live[other] &= ~mask
+    if not all(live.values()):
+        return None
+
+    plan = {}
+    for variable in sorted(unassigned, key=lambda v: len(unassigned[v])):
+        domain = unassigned[variable]
+        # Least-constraining value: fewest values ruled out elsewhere.
+        scores = [
+            sum(
+                _popcount(mask)
+                for other, mask in masks.get((variable, index), {}).items()
+                if other in live
+            )
+            for index in range(len(domain))
+        ]
+        order = sorted(range(len(domain)), key=scores.__getitem__)
+        plan[variable] = (order, domain)
 
-    return None
+    return _search(assignment, plan, live, masks)
 
 
 # ==========================================================
@@ -276,14 +529,9 @@ def generate_schedule():
     start_time = request.form.get("start_time", "07:00")
     end_time = request.form.get("end_time", "19:00")
 
-    try:
-        start_dt = datetime.strptime(start_time, TIME_FORMAT)
-        end_dt = datetime.strptime(end_time, TIME_FORMAT)
-    except ValueError:
-        flash(ERROR_MESSAGES["invalid_input"], FLASH_CATEGORIES["danger"])
-        return redirect(url_for(AUTO_SCHEDULER_HOME))
-
-    if start_dt >= end_dt:
+    start_min = _parse_hhmm(start_time)
+    end_min = _parse_hhmm(end_time)
+    if start_min is None or end_min is None or start_min >= end_min:
         flash(ERROR_MESSAGES["invalid_input"], FLASH_CATEGORIES["danger"])
         return redirect(url_for(AUTO_SCHEDULER_HOME))
 
@@ -411,6 +659,60 @@ if __name__ == "__main__":
     else:
         print("  No assignment found [FAIL]")
 
+    # ------------------------------------------------------
+    # BACKJUMPING TEST
+    # ------------------------------------------------------
+    print("\nRunning backjumping test...")
+
+    def single_session(instructor_id, room_id, day, start, end):
+        return [
+            {
+                "subject_id": instructor_id,
+                "instructor_id": instructor_id,
+                "room_id": room_id,
+                "day_of_week": day,
+                "start_time": start,
+                "end_time": end,
+            }
+        ]
+
+    # A is tried with its first value (tied on LCV), which leaves D two slots.
+    # X is unrelated. Both C values then take those slots, so C dead-ends
+    # because of A and the search must jump back over X to retry A.
+    backjump_domains = {
+        "A": [
+            single_session(1, 10, "Mon", "08:00", "10:00"),
+            single_session(1, 40, "Thu", "08:00", "10:00"),
+        ],
+        "X": [
+            single_session(2, 30, "Wed", "08:00", "09:00"),
+            single_session(2, 30, "Wed", "09:00", "10:00"),
+        ],
+        "C": [
+            single_session(3, 10, "Mon", "10:00", "12:00"),
+            single_session(3, 10, "Mon", "10:30", "11:30"),
+        ],
+        "D": [
+            single_session(4, 10, "Mon", f"{hour:02d}:00", f"{hour + 1:02d}:00")
+            for hour in (8, 9, 10, 11)
+        ],
+        "E": [
+            single_session(5, 40, "Thu", f"{hour:02d}:00", f"{hour + 1:02d}:00")
+            for hour in (8, 9, 10, 11)
+        ],
+    }
+
+    backjump_result = backtrack(
+        {}, {key: list(value) for key, value in backjump_domains.items()}
+    )
+    chosen = (
+        {key: backjump_domains[key].index(value) for key, value in backjump_result.items()}
+        if backjump_result
+        else None
+    )
+    expected = {"A": 1, "X": 0, "C": 0, "D": 0, "E": 2}
+    print(f"  Backjump assignment -> {chosen} [{'PASS' if chosen == expected else 'FAIL'}]")
+
     # ------------------------------------------------------
     # TIME VALIDATION TESTS
     # ------------------------------------------------------
@@ -424,12 +726,9 @@ if __name__ == "__main__":
     ]
 
     for start_input, end_input, expected in time_tests:
-        try:
-            start_dt = datetime.strptime(start_input, TIME_FORMAT)
-            end_dt = datetime.strptime(end_input, TIME_FORMAT)
-            valid = start_dt < end_dt
-        except ValueError:
-            valid = False
+        start_min = _parse_hhmm(start_input)
+        end_min = _parse_hhmm(end_input)
+        valid = start_min is not None and end_min is not None and start_min < end_min
 
         status = "PASS" if valid == expected else "FAIL"
         print(
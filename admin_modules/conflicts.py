@@ -8,7 +8,12 @@ input validation, error handling, and unit tests.
 # STANDARD LIBRARY IMPORTS
 # ==========================================================
 
+from collections import defaultdict
 from datetime import datetime, time, timedelta
+from functools import lru_cache
+import heapq
+import logging
+import os
 import unittest
 
 # ==========================================================
@@ -16,9 +21,11 @@ import unittest
 # ==========================================================
 
 import mysql.connector
+from mysql.connector import pooling
 from flask import (
     Blueprint,
     flash,
+    g,
     redirect,
     render_template,
     request,
@@ -32,6 +39,8 @@ from flask import (
 
 conflicts_bp = Blueprint('conflicts', __name__, url_prefix='/admin/conflicts')
 
+logger = logging.getLogger(__name__)
+
 # ==========================================================
 # DATABASE CONFIGURATION
 # ==========================================================
@@ -43,6 +52,24 @@ DB_CONFIG = {
     'database': 'iload'
 }
 
+DB_POOL_NAME = 'conflicts'
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '8'))
+
+if not 1 <= DB_POOL_SIZE <= pooling.CNX_POOL_MAXSIZE:
+    # Fail at startup rather than on the first pooled request.
+    raise ValueError(
+        f"Invalid DB_POOL_SIZE {DB_POOL_SIZE}: "
+        f"must be between 1 and {pooling.CNX_POOL_MAXSIZE}"
+    )
+
+# Unique key on conflicts (schedule1_id, schedule2_id); see iload.sql and,
+# for older databases, iload_conflicts_pair_key.sql.
+CONFLICT_PAIR_KEY = 'uq_conflicts_pair'
+
+# Set by _ensure_conflict_pair_key at startup; until it is True the save
+# path cannot lean on the key and checks each pair itself.
+_conflict_pair_key_present = False
+
 # ==========================================================
 # CONSTANTS & ENUM-LIKE MAPS
 # ==========================================================
@@ -127,9 +154,20 @@ TIME_FORMATS = {
 # DATABASE & SECURITY UTILITIES
 # ==========================================================
 
+@lru_cache(maxsize=1)
+def _get_pool():
+    return pooling.MySQLConnectionPool(
+        pool_name=DB_POOL_NAME,
+        pool_size=DB_POOL_SIZE,
+        pool_reset_session=True,
+        **DB_CONFIG
+    )
+
+
 def get_db_connection():
+    # close() on a pooled connection hands it back to the pool.
     try:
-        return mysql.connector.connect(**DB_CONFIG)
+        return _get_pool().get_connection()
     except mysql.connector.Error as e:
         raise ConnectionError(
             ERROR_MESSAGES['db_connection_error'].format(error=str(e))
@@ -148,9 +186,12 @@ def inject_instructor_name():
             DB_FIELDS['image']: None
         }
 
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+    # Context processors run on every render; look the user up once per request.
+    cached = g.get('conflicts_instructor_ctx')
+    if cached is not None:
+        return cached
+
+    with get_db_connection() as conn, conn.cursor(dictionary=True) as cursor:
         query = (
             f"SELECT {DB_FIELDS['name']}, {DB_FIELDS['image']} "
             f"FROM {DB_TABLES['instructors']} "
@@ -158,30 +199,47 @@ def inject_instructor_name():
         )
         cursor.execute(query, (session['user_id'],))
         instructor = cursor.fetchone()
-    finally:
-        cursor.close()
-        conn.close()
 
-    return {
+    g.conflicts_instructor_ctx = {
         DB_FIELDS['instructor_name']:
             instructor[DB_FIELDS['name']] if instructor else None,
         DB_FIELDS['image']:
             instructor[DB_FIELDS['image']]
             if instructor and instructor[DB_FIELDS['image']] else None
     }
+    return g.conflicts_instructor_ctx
 
 # ==========================================================
 # TIME HANDLING UTILITIES
 # ==========================================================
 
+# Schedules reuse a small set of start/end times, so the parsed and
+# formatted forms are memoized.
+TIME_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def _time_from_seconds(total_seconds):
+    return time(
+        hour=total_seconds // 3600,
+        minute=(total_seconds % 3600) // 60,
+        second=total_seconds % 60
+    )
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def _parse_time_str(value):
+    return datetime.strptime(value, TIME_FORMATS['24h']).time()
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def _format_time_12h(value):
+    return value.strftime(TIME_FORMATS['12h'])
+
+
 def timedelta_to_time(td):
     if isinstance(td, timedelta):
-        total_seconds = int(td.total_seconds())
-        return time(
-            hour=total_seconds // 3600,
-            minute=(total_seconds % 3600) // 60,
-            second=total_seconds % 60
-        )
+        return _time_from_seconds(int(td.total_seconds()))
     return td
 
 
@@ -192,7 +250,7 @@ def parse_time(value):
         if isinstance(value, timedelta):
             return timedelta_to_time(value)
         if isinstance(value, str):
-            return datetime.strptime(value, TIME_FORMATS['24h']).time()
+            return _parse_time_str(value)
     except Exception:
         raise ValueError(
             ERROR_MESSAGES['invalid_time_format'].format(value=value)
@@ -200,8 +258,12 @@ def parse_time(value):
     return value
 
 
+def time_to_seconds(value):
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 def format_time_12h(value):
-    return value.strftime(TIME_FORMATS['12h']) if isinstance(value, time) else str(value)
+    return _format_time_12h(value) if isinstance(value, time) else str(value)
 
 # ==========================================================
 # LOW-LEVEL CONFLICT HELPERS
@@ -218,6 +280,38 @@ def same_instructor(s1, s2):
 def same_room(s1, s2):
     return s1[DB_FIELDS['room_id']] == s2[DB_FIELDS['room_id']]
 
+
+def overlapping_pairs(schedules, starts, ends):
+    """
+    Index pairs (i, j), i < j, of same-day schedules whose times overlap,
+    in the order a nested scan over ``schedules`` would produce them.
+
+    Each day is swept in start order with a heap of open schedules keyed
+    by end time, so only schedules still open when another one starts
+    are ever compared.
+    """
+    by_day = defaultdict(list)
+    for idx, schedule in enumerate(schedules):
+        by_day[schedule[DB_FIELDS['day_of_week']]].append(idx)
+
+    pairs = []
+    for indices in by_day.values():
+        indices.sort(key=starts.__getitem__)
+        active = []
+        for j in indices:
+            start, end = starts[j], ends[j]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            # Every open schedule started no later than ``start`` and ends
+            # after it, so only the other half of the overlap test remains.
+            for _, i in active:
+                if starts[i] < end:
+                    pairs.append((i, j) if i < j else (j, i))
+            heapq.heappush(active, (end, j))
+
+    pairs.sort()
+    return pairs
+
 # ==========================================================
 # INPUT VALIDATION
 # ==========================================================
@@ -243,50 +337,109 @@ def validate_schedule(schedule):
 # DATABASE WRITE OPERATIONS
 # ==========================================================
 
-def save_conflict_to_db(
-    schedule1_id,
-    schedule2_id,
-    conflict_type,
-    description,
-    recommendation
-):
+@conflicts_bp.record_once
+def _ensure_conflict_pair_key(_state):
+    """
+    Add the pair key, once at app startup, to databases created before it
+    was in the schema. Failures are logged rather than raised: the ALTER
+    needs the privilege and no duplicate pairs on record, and
+    iload_conflicts_pair_key.sql covers the cases it cannot. Until then
+    save_conflicts_to_db falls back to a per-row existence check.
+    """
+    global _conflict_pair_key_present
+
+    conn = cursor = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        query = f"""
-            SELECT COUNT(*) FROM {DB_TABLES['conflicts']}
-            WHERE {DB_FIELDS['schedule1_id']} = %s
-            AND {DB_FIELDS['schedule2_id']} = %s
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() "
+            "AND table_name = %s AND index_name = %s",
+            (DB_TABLES['conflicts'], CONFLICT_PAIR_KEY)
+        )
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(
+                f"ALTER TABLE {DB_TABLES['conflicts']} "
+                f"ADD UNIQUE KEY {CONFLICT_PAIR_KEY} "
+                f"({DB_FIELDS['schedule1_id']}, {DB_FIELDS['schedule2_id']})"
+            )
+        _conflict_pair_key_present = True
+    except (ConnectionError, mysql.connector.Error) as e:
+        logger.warning(
+            "Could not ensure %s on %s (%s); conflicts will be saved one "
+            "row at a time until iload_conflicts_pair_key.sql is applied.",
+            CONFLICT_PAIR_KEY, DB_TABLES['conflicts'], e
+        )
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+
+
+def save_conflicts_to_db(rows):
+    """
+    Insert (schedule1_id, schedule2_id, conflict_type, description,
+    recommendation) rows. Pairs already on record are left untouched: in
+    one batch via the unique key on (schedule1_id, schedule2_id), or row by
+    row with a NOT EXISTS check when the key could not be ensured.
+    """
+    if not rows:
+        return
+
+    if not _conflict_pair_key_present:
+        _save_conflicts_unkeyed(rows)
+        return
+
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        insert_query = f"""
+            INSERT INTO {DB_TABLES['conflicts']}
+            ({DB_FIELDS['schedule1_id']},
+             {DB_FIELDS['schedule2_id']},
+             {DB_FIELDS['conflict_type']},
+             {DB_FIELDS['description']},
+             {DB_FIELDS['recommendation']},
+             {DB_FIELDS['status']})
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                {DB_FIELDS['schedule1_id']} = {DB_FIELDS['schedule1_id']}
         """
-        cursor.execute(query, (schedule1_id, schedule2_id))
+        cursor.executemany(
+            insert_query,
+            [row + (STATUS_TYPES['unresolved'],) for row in rows]
+        )
+        conn.commit()
 
-        if cursor.fetchone()[0] == 0:
-            insert_query = f"""
-                INSERT INTO {DB_TABLES['conflicts']}
-                ({DB_FIELDS['schedule1_id']},
-                 {DB_FIELDS['schedule2_id']},
-                 {DB_FIELDS['conflict_type']},
-                 {DB_FIELDS['description']},
-                 {DB_FIELDS['recommendation']},
-                 {DB_FIELDS['status']})
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
+
+def _save_conflicts_unkeyed(rows):
+    """
+    Fallback for databases without the pair key: insert each row only if
+    its (schedule1_id, schedule2_id) pair is not already on record.
+    """
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        insert_query = f"""
+            INSERT INTO {DB_TABLES['conflicts']}
+            ({DB_FIELDS['schedule1_id']},
+             {DB_FIELDS['schedule2_id']},
+             {DB_FIELDS['conflict_type']},
+             {DB_FIELDS['description']},
+             {DB_FIELDS['recommendation']},
+             {DB_FIELDS['status']})
+            SELECT %s, %s, %s, %s, %s, %s FROM DUAL
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {DB_TABLES['conflicts']}
+                WHERE {DB_FIELDS['schedule1_id']} = %s
+                AND {DB_FIELDS['schedule2_id']} = %s
+            )
+        """
+        for row in rows:
             cursor.execute(
                 insert_query,
-                (
-                    schedule1_id,
-                    schedule2_id,
-                    conflict_type,
-                    description,
-                    recommendation,
-                    STATUS_TYPES['unresolved']
-                )
+                row + (STATUS_TYPES['unresolved'], row[0], row[1])
             )
-            conn.commit()
-    finally:
-        cursor.close()
-        conn.close()
+        conn.commit()
 
 # ==========================================================
 # CONFLICT DETECTION LOGIC
@@ -308,7 +461,7 @@ def detect_instructor_conflict(s1, s2, day, start1, end1, start2, end2):
         instructor_name=s1[DB_FIELDS['instructor_name']]
     )
 
-    save_conflict_to_db(
+    return (
         s1[DB_FIELDS['schedule_id']],
         s2[DB_FIELDS['schedule_id']],
         CONFLICT_TYPES['instructor'],
@@ -329,7 +482,7 @@ def detect_room_conflict(s1, s2, day, start1, end1, start2, end2):
         end2=format_time_12h(end2)
     )
 
-    save_conflict_to_db(
+    return (
         s1[DB_FIELDS['schedule_id']],
         s2[DB_FIELDS['schedule_id']],
         CONFLICT_TYPES['room'],
@@ -339,10 +492,7 @@ def detect_room_conflict(s1, s2, day, start1, end1, start2, end2):
 
 
 def detect_and_save_conflicts():
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
+    with get_db_connection() as conn, conn.cursor(dictionary=True) as cursor:
         query = f"""
             SELECT sc.{DB_FIELDS['schedule_id']},
                    sc.{DB_FIELDS['day_of_week']},
@@ -369,38 +519,34 @@ def detect_and_save_conflicts():
         """
         cursor.execute(query)
         schedules = cursor.fetchall()
-    finally:
-        cursor.close()
-        conn.close()
 
-    for i, s1 in enumerate(schedules):
-        validate_schedule(s1)
+    for schedule in schedules:
+        validate_schedule(schedule)
 
-        day = s1[DB_FIELDS['day_of_week']]
-        start1 = parse_time(s1[DB_FIELDS['start_time']])
-        end1 = parse_time(s1[DB_FIELDS['end_time']])
+    starts = [parse_time(s[DB_FIELDS['start_time']]) for s in schedules]
+    ends = [parse_time(s[DB_FIELDS['end_time']]) for s in schedules]
 
-        for s2 in schedules[i + 1:]:
-            if day != s2[DB_FIELDS['day_of_week']]:
-                continue
+    # The sweep compares plain ints; time objects are only needed for
+    # the 12h labels in conflict descriptions.
+    start_secs = [time_to_seconds(t) for t in starts]
+    end_secs = [time_to_seconds(t) for t in ends]
 
-            validate_schedule(s2)
-
-            start2 = parse_time(s2[DB_FIELDS['start_time']])
-            end2 = parse_time(s2[DB_FIELDS['end_time']])
+    rows = []
+    for i, j in overlapping_pairs(schedules, start_secs, end_secs):
+        s1, s2 = schedules[i], schedules[j]
+        day = s1[DB_FIELDS['day_of_week']]
 
-            if not schedules_overlap(start1, end1, start2, end2):
-                continue
+        if same_instructor(s1, s2):
+            rows.append(detect_instructor_conflict(
+                s1, s2, day, starts[i], ends[i], starts[j], ends[j]
+            ))
 
-            if same_instructor(s1, s2):
-                detect_instructor_conflict(
-                    s1, s2, day, start1, end1, start2, end2
-                )
+        if same_room(s1, s2):
+            rows.append(detect_room_conflict(
+                s1, s2, day, starts[i], ends[i], starts[j], ends[j]
+            ))
 
-            if same_room(s1, s2):
-                detect_room_conflict(
-                    s1, s2, day, start1, end1, start2, end2
-                )
+    save_conflicts_to_db(rows)
 
 # ==========================================================
 # ROUTES
@@ -413,10 +559,7 @@ def list_conflicts():
 
     detect_and_save_conflicts()
 
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
+    with get_db_connection() as conn, conn.cursor(dictionary=True) as cursor:
         query = f"""
             SELECT c.*,
                    s1.{DB_FIELDS['start_time']} AS s1_start,
@@ -432,9 +575,6 @@ def list_conflicts():
         """
         cursor.execute(query)
         conflicts = cursor.fetchall()
-    finally:
-        cursor.close()
-        conn.close()
 
     return render_template("admin/conflicts.html", conflicts=conflicts)
 
@@ -444,10 +584,7 @@ def resolve_conflict(conflict_id):
     if not is_admin():
         return redirect(url_for('login'))
 
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
+    with get_db_connection() as conn, conn.cursor() as cursor:
         query = (
             f"UPDATE {DB_TABLES['conflicts']} "
             f"SET {DB_FIELDS['status']} = %s "
@@ -455,9 +592,6 @@ def resolve_conflict(conflict_id):
         )
         cursor.execute(query, (STATUS_TYPES['resolved'], conflict_id))
         conn.commit()
-    finally:
-        cursor.close()
-        conn.close()
 
     flash(
         ERROR_MESSAGES['conflict_resolved'].format(conflict_id=conflict_id),
@@ -526,4 +660,30 @@ if __name__ == "__main__":
     print(f"Same room A&B: {'PASS' if same_room(schedule_a, schedule_b) else 'FAIL'}")
     print(f"Same room A&C: {'PASS' if not same_room(schedule_a, schedule_c) else 'FAIL'}")
 
+    # Nested, touching and zero-length intervals on one day, plus a
+    # same-time slot on another day that must never pair up.
+    sweep_rows = [
+        ('Monday', '09:00:00', '12:00:00'),
+        ('Monday', '09:30:00', '10:00:00'),
+        ('Monday', '10:00:00', '11:00:00'),
+        ('Monday', '11:00:00', '11:00:00'),
+        ('Monday', '12:00:00', '13:00:00'),
+        ('Tuesday', '09:00:00', '12:00:00'),
+    ]
+    sweep_schedules = [{DB_FIELDS['day_of_week']: day} for day, _, _ in sweep_rows]
+    sweep_starts = [time_to_seconds(parse_time(start)) for _, start, _ in sweep_rows]
+    sweep_ends = [time_to_seconds(parse_time(end)) for _, _, end in sweep_rows]
+
+    brute_force_pairs = [
+        (i, j)
+        for i in range(len(sweep_rows))
+        for j in range(i + 1, len(sweep_rows))
+        if sweep_rows[i][0] == sweep_rows[j][0]
+        and schedules_overlap(sweep_starts[i], sweep_ends[i], sweep_starts[j], sweep_ends[j])
+    ]
+    sweep_pairs = overlapping_pairs(sweep_schedules, sweep_starts, sweep_ends)
+
+    print(f"Sweep pairs {sweep_pairs}: {'PASS' if sweep_pairs == [(0, 1), (0, 2), (0, 3)] else 'FAIL'}")
+    print(f"Sweep matches nested scan: {'PASS' if sweep_pairs == brute_force_pairs else 'FAIL'}")
+
     print("\nInteractive tests completed!")
@@ -8,7 +8,7 @@ Handles fetching stats, top instructors, room usage, and conflicts.
 # ==================================================
 import mysql.connector
 from flask import Blueprint, render_template, session, redirect, url_for
-from .admin_routes import get_instructor_name, db_config
+from .admin_routes import get_instructor_name, get_db_connection
 
 
 # ==================================================
@@ -29,11 +29,6 @@ NO_INSTRUCTOR_INFO = {
 # ==================================================
 # 4. Database & Auth Helpers
 # ==================================================
-def get_db_connection():
-    """Return a new database connection."""
-    return mysql.connector.connect(**db_config)
-
-
 def is_admin():
     """Return True if current session user is an admin."""
     return session.get("role") == "admin"
@@ -48,15 +43,13 @@ def inject_instructor_name():
     if "user_id" not in session:
         return NO_INSTRUCTOR_INFO
 
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute(
-        "SELECT name, image FROM instructors WHERE instructor_id = %s",
-        (session["user_id"],)
-    )
-    instructor = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    # The connection is borrowed from the admin pool; always hand it back.
+    with get_db_connection() as conn, conn.cursor(dictionary=True) as cursor:
+        cursor.execute(
+            "SELECT name, image FROM instructors WHERE instructor_id = %s",
+            (session["user_id"],)
+        )
+        instructor = cursor.fetchone()
 
     return {
         "instructor_name": instructor["name"] if instructor else None,
@@ -6,6 +6,9 @@ Handles login, listing, adding, editing, and deleting instructors.
 # ==================================================
 # 1. Imports
 # ==================================================
+import os
+import sys
+
 import mysql.connector
 from flask import (
     Blueprint,
@@ -16,7 +19,15 @@ from flask import (
     flash,
     session,
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+
+try:
+    from db import hash_password
+except ImportError:
+    # Direct script run from admin_modules/: db.py lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db import hash_password
+from instructor_module.instructor_bp import forget_instructor_names
 
 
 # ==================================================
@@ -181,7 +192,7 @@ def add_instructor():
             "role": request.form.get("role", "").strip(),
         }
 
-        hashed_password = generate_password_hash(data["password"])
+        hashed_password = hash_password(data["password"])
 
         conn = get_db_connection()
         cursor = conn.cursor()
@@ -256,6 +267,7 @@ def edit_instructor(instructor_id):
             ),
         )
         conn.commit()
+        forget_instructor_names()
         cursor.close()
         conn.close()
 
@@ -291,6 +303,7 @@ def delete_instructor(instructor_id):
         (instructor_id,),
     )
     conn.commit()
+    forget_instructor_names()
     cursor.close()
     conn.close()
 
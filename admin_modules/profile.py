@@ -88,6 +88,17 @@ def profile():
 
 import re
 
+_SANITIZE_PATTERNS = {
+    "name": re.compile(r"^[A-Za-z\s\-']{2,100}$"),
+    "username": re.compile(r"^[A-Za-z0-9_]{3,50}$"),
+    "department": re.compile(r"^[A-Za-z\s&]{2,100}$")
+}
+
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_LOWER = re.compile(r"[a-z]")
+_RE_DIGIT = re.compile(r"\d")
+_RE_SPECIAL = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+
 
 def sanitize_input(value, field_type):
     """
@@ -101,17 +112,11 @@ def sanitize_input(value, field_type):
     if not value:
         return None
 
-    patterns = {
-        "name": r"^[A-Za-z\s\-']{2,100}$",
-        "username": r"^[A-Za-z0-9_]{3,50}$",
-        "department": r"^[A-Za-z\s&]{2,100}$"
-    }
-
-    pattern = patterns.get(field_type)
-    if not pattern:
+    pattern = _SANITIZE_PATTERNS.get(field_type)
+    if pattern is None:
         return None
 
-    if not re.fullmatch(pattern, value):
+    if not pattern.fullmatch(value):
         return None
 
     return value
@@ -127,13 +132,13 @@ def validate_password_strength(password):
 
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
-    if not re.search(r"[A-Z]", password):
+    if not _RE_UPPER.search(password):
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r"[a-z]", password):
+    if not _RE_LOWER.search(password):
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r"\d", password):
+    if not _RE_DIGIT.search(password):
         return False, "Password must contain at least one number"
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if not _RE_SPECIAL.search(password):
         return False, "Password must contain at least one special character"
 
     return True, "Password is strong"
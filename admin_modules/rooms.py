@@ -8,6 +8,7 @@ Handles listing, adding, editing, deleting rooms with image upload support.
 # ------------------------
 import os
 import re
+from functools import lru_cache
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, current_app
 from werkzeug.utils import secure_filename
 import mysql.connector
@@ -24,7 +25,8 @@ db_config = {
     'database': 'iload'
 }
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg'})
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # copy uploads to disk in 1 MiB chunks
 ROOMS_LIST_ROUTE = 'rooms.list_rooms'
 
 # ------------------------
@@ -40,7 +42,8 @@ def is_admin():
 
 def allowed_file(filename):
     """Check if the uploaded file is allowed based on extension."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
 
 def parse_programs(program_input):
     """Split input into multiple programs (separated by '/' or ',')."""
@@ -48,14 +51,22 @@ def parse_programs(program_input):
         return []
     return [p.strip() for p in program_input.replace(',', '/').split('/') if p.strip()]
 
+@lru_cache(maxsize=None)
+def get_upload_folder(root_path):
+    """Resolve the room image folder and create it once per app root."""
+    upload_folder = os.path.join(root_path, 'static', 'room_images')
+    os.makedirs(upload_folder, exist_ok=True)
+    return upload_folder
+
 def save_image_file(image_file):
     """Save uploaded image to static folder and return filename."""
     if not image_file or not allowed_file(image_file.filename):
         return None
     filename = secure_filename(image_file.filename)
-    upload_folder = os.path.join(current_app.root_path, 'static', 'room_images')
-    os.makedirs(upload_folder, exist_ok=True)
-    image_file.save(os.path.join(upload_folder, filename))
+    image_file.save(
+        os.path.join(get_upload_folder(current_app.root_path), filename),
+        buffer_size=UPLOAD_BUFFER_SIZE
+    )
     return filename
 
 def fetch_program_suggestions():
@@ -1,5 +1,8 @@
 # db.py
+import os
+
 import mysql.connector
+from werkzeug.security import generate_password_hash
 
 db_config = {
     'host': 'localhost',
@@ -8,5 +11,22 @@ db_config = {
     'database': 'iload'
 }
 
+# Werkzeug hash method, e.g. 'pbkdf2:sha256:600000' or 'scrypt:32768:8:1'.
+# Unset keeps Werkzeug's default; test runs can pick a cheaper cost here.
+PW_HASH_METHOD = os.environ.get('PW_HASH_METHOD')
+
+if PW_HASH_METHOD:
+    # Fail at startup on a typo rather than on the first password change.
+    try:
+        generate_password_hash('', method=PW_HASH_METHOD)
+    except ValueError as e:
+        raise ValueError(f"Invalid PW_HASH_METHOD {PW_HASH_METHOD!r}: {e}") from e
+
 def get_db_connection():
     return mysql.connector.connect(**db_config)
+
+def hash_password(password):
+    """Hash a password with the configured PW_HASH_METHOD."""
+    if PW_HASH_METHOD:
+        return generate_password_hash(password, method=PW_HASH_METHOD)
+    return generate_password_hash(password)
@@ -437,7 +437,8 @@ INSERT INTO `subjects` (`subject_id`, `code`, `name`, `units`, `year_level`, `se
 -- Indexes for table `conflicts`
 --
 ALTER TABLE `conflicts`
-  ADD PRIMARY KEY (`conflict_id`);
+  ADD PRIMARY KEY (`conflict_id`),
+  ADD UNIQUE KEY `uq_conflicts_pair` (`schedule1_id`,`schedule2_id`);
 
 --
 -- Indexes for table `courses`
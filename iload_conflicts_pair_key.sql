@@ -0,0 +1,20 @@
+--
+-- Migration: one conflicts row per schedule pair
+--
+-- Databases created from iload.sql before `uq_conflicts_pair` was added
+-- may hold repeated (schedule1_id, schedule2_id) rows. Keep the oldest row
+-- of each pair, then add the unique key that conflict detection relies on.
+--
+
+START TRANSACTION;
+
+DELETE c FROM `conflicts` c
+  JOIN `conflicts` keep
+    ON keep.`schedule1_id` = c.`schedule1_id`
+   AND keep.`schedule2_id` = c.`schedule2_id`
+   AND keep.`conflict_id` < c.`conflict_id`;
+
+COMMIT;
+
+ALTER TABLE `conflicts`
+  ADD UNIQUE KEY `uq_conflicts_pair` (`schedule1_id`,`schedule2_id`);
@@ -1,10 +1,13 @@
 import os
 import re
+from functools import lru_cache
 from flask import Blueprint, render_template, session, redirect, url_for, request, flash, current_app
 import mysql.connector
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from db import hash_password
 from datetime import datetime, time, timedelta
+from time import monotonic
 
 instructor_bp = Blueprint('instructor', __name__, url_prefix='/instructor')
 
@@ -15,10 +18,38 @@ db_config = {
     'database': 'iload'
 }
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif'})
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # copy uploads to disk in 1 MiB chunks
+
+# Instructor names rarely change; cache lookups per username for a few minutes.
+# Edits made in this process evict it; other workers may lag by up to the TTL.
+INSTRUCTOR_NAME_TTL = 300  # seconds
+_instructor_name_cache = {}
 
 ALL_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
+PROFILE_UPDATE_FIELDS = ('name', 'department', 'max_load_units')
+
+def _build_profile_update_query(with_image, with_password):
+    fields = list(PROFILE_UPDATE_FIELDS)
+    if with_image:
+        fields.append('image')
+    if with_password:
+        fields.append('password')
+    assignments = ', '.join(f'{field} = %s' for field in fields)
+    query = f"UPDATE instructors SET {assignments} WHERE username = %s"
+    if with_password:
+        # Only replace the hash that was verified; a concurrent change makes this match nothing
+        query += " AND password = %s"
+    return query
+
+# Only four column sets are possible, so build every UPDATE statement once
+PROFILE_UPDATE_QUERIES = {
+    (with_image, with_password): _build_profile_update_query(with_image, with_password)
+    for with_image in (False, True)
+    for with_password in (False, True)
+}
+
 def format_time_12hr(time_obj):
     return time_obj.strftime('%I:%M %p')
 
@@ -28,17 +59,52 @@ def normalize_day(day_str):
 def is_instructor():
     return session.get('role') == 'instructor'
 
+PASSWORD_RULES = (
+    re.compile(r'[A-Z]'),
+    re.compile(r'[a-z]'),
+    re.compile(r'[0-9]'),
+    re.compile(r'[!@#$%^&*(),.?":{}|<>]'),
+)
+
+def is_valid_password(pw):
+    if len(pw) < 8:
+        return False
+    return all(rule.search(pw) for rule in PASSWORD_RULES)
+
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
+
+@lru_cache(maxsize=None)
+def get_upload_folder(root_path):
+    """Resolve the profile upload folder and create it once per app root."""
+    upload_folder = os.path.join(root_path, 'static', 'uploads')
+    os.makedirs(upload_folder, exist_ok=True)
+    return upload_folder
+
+def forget_instructor_names():
+    """Drop cached names, e.g. after an admin edits or deletes an instructor."""
+    _instructor_name_cache.clear()
 
 def get_instructor_name(username):
+    cached = _instructor_name_cache.get(username)
+    if cached and cached[0] > monotonic():
+        return cached[1]
+
+    connection = None
+    cursor = None
     try:
         connection = mysql.connector.connect(**db_config)
         cursor = connection.cursor(dictionary=True)
         query = "SELECT name FROM instructors WHERE username = %s"
         cursor.execute(query, (username,))
         result = cursor.fetchone()
-        return result['name'] if result else None
+        if not result:
+            # Don't cache misses, so a newly added instructor shows up at once
+            return None
+        name = result['name']
+        _instructor_name_cache[username] = (monotonic() + INSTRUCTOR_NAME_TTL, name)
+        return name
     except mysql.connector.Error as err:
         print(f"Database error: {err}")
         return None
@@ -100,10 +166,8 @@ def profile():
             if image_file and image_file.filename != '':
                 if allowed_file(image_file.filename):
                     filename = secure_filename(image_file.filename)
-                    upload_folder = os.path.join(current_app.root_path, 'static/uploads')
-                    os.makedirs(upload_folder, exist_ok=True)
-                    image_path = os.path.join(upload_folder, filename)
-                    image_file.save(image_path)
+                    image_path = os.path.join(get_upload_folder(current_app.root_path), filename)
+                    image_file.save(image_path, buffer_size=UPLOAD_BUFFER_SIZE)
                     image_filename = filename
                 else:
                     flash('Invalid image format! Allowed types: png, jpg, jpeg, gif', 'danger')
@@ -123,41 +187,33 @@ def profile():
                     flash('New password and confirmation do not match.', 'danger')
                     return redirect(url_for('instructor.profile'))
 
-                def is_valid_password(pw):
-                    if len(pw) < 8:
-                        return False
-                    if not re.search(r'[A-Z]', pw):
-                        return False
-                    if not re.search(r'[a-z]', pw):
-                        return False
-                    if not re.search(r'[0-9]', pw):
-                        return False
-                    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', pw):
-                        return False
-                    return True
-
                 if not is_valid_password(new_password):
                     flash('Password must be at least 8 characters long and include uppercase, lowercase, number, and special symbol.', 'danger')
                     return redirect(url_for('instructor.profile'))
 
-                hashed_password = generate_password_hash(new_password)
+                hashed_password = hash_password(new_password)
 
-            update_fields = ['name = %s', 'department = %s', 'max_load_units = %s']
             update_values = [new_name, new_department, new_max_load]
 
             if image_filename:
-                update_fields.append('image = %s')
                 update_values.append(image_filename)
 
             if hashed_password:
-                update_fields.append('password = %s')
                 update_values.append(hashed_password)
 
             update_values.append(username)
 
-            update_query = f"UPDATE instructors SET {', '.join(update_fields)} WHERE username = %s"
+            if hashed_password:
+                update_values.append(user['password'])
+
+            update_query = PROFILE_UPDATE_QUERIES[(bool(image_filename), bool(hashed_password))]
             cursor.execute(update_query, tuple(update_values))
+            if hashed_password and cursor.rowcount == 0:
+                connection.rollback()
+                flash('Your password was changed elsewhere. Please try again.', 'danger')
+                return redirect(url_for('instructor.profile'))
             connection.commit()
+            _instructor_name_cache.pop(username, None)
 
             flash('Profile updated successfully!', 'success')
             return redirect(url_for('instructor.profile'))